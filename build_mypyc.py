@@ -0,0 +1,14 @@
+"""Optional native build of main.py with mypyc.
+
+The script runs fine as plain Python; this only exists to compile it:
+
+    pip install mypy setuptools
+    python build_mypyc.py build_ext --inplace
+
+It is deliberately not called setup.py, so that `pip install .` keeps
+installing the plain-Python package without needing mypy.
+"""
+from mypyc.build import mypycify
+from setuptools import setup
+
+setup(name="bib2txt", py_modules=["main"], ext_modules=mypycify(["main.py"]))
@@ -1,12 +1,53 @@
-import bibtexparser
-from bibtexparser.bparser import BibTexParser
-import argparse
-from pylatexenc.latex2text import LatexNodes2Text
-
-# Initialize the LaTeX to text converter
-latex_converter = LatexNodes2Text()
-
-def clean_latex(text):
+from __future__ import annotations
+
+import hashlib
+import mmap
+import os
+import pickle
+import re
+import sys
+import unicodedata
+from collections.abc import Callable, Iterable, Iterator
+from stat import S_ISREG
+from types import SimpleNamespace
+
+# Stands in for typing.TYPE_CHECKING without importing typing at runtime;
+# type checkers treat the name specially
+TYPE_CHECKING = False
+if TYPE_CHECKING:
+    import argparse
+    from typing import BinaryIO
+
+    from pylatexenc.latex2text import LatexNodes2Text
+
+# A parsed BibTeX entry: lowercase field names plus 'ENTRYTYPE' and 'ID'
+Entry = dict[str, str]
+
+# The LaTeX to text converter is expensive to import and build, and plain
+# text never needs it, so it is created on first use (see _get_converter)
+_latex_converter: LatexNodes2Text | None = None
+
+# arXiv detection, compiled once rather than per entry and field. Both are
+# matched against lowercased text, so they need no re.IGNORECASE. Within a
+# field the leftmost ID wins, whichever of the three prefixes it has.
+_ARXIV_RE = re.compile(r'(?:arxiv[:/]|abs/)(\d+\.\d+)')
+_ARXIV_MARKER_RE = re.compile(r'arxiv|preprint')
+
+# Separator between names in author/editor lists
+_AND_RE = re.compile(r'\s+and\s+')
+
+# Anything pylatexenc would rewrite: special characters, dash ligatures and
+# quote ligatures. Text without any of these comes out of it unchanged.
+_LATEX_MARKER_RE = re.compile(r"[{}\\$^_~%&`]|--|''")
+
+def _get_converter() -> LatexNodes2Text:
+    global _latex_converter
+    if _latex_converter is None:
+        from pylatexenc.latex2text import LatexNodes2Text
+        _latex_converter = LatexNodes2Text()
+    return _latex_converter
+
+def clean_latex(text: str | None) -> str:
     """
     Clean LaTeX-specific formatting using pylatexenc,
     which properly handles LaTeX commands and special characters.
@@ -14,15 +55,106 @@ def clean_latex(text):
     if not text:
         return ""
 
-    # Convert LaTeX to plain text
-    text = latex_converter.latex_to_text(text)
-
-    # Fix any remaining double dashes to single dash for page ranges
-    text = text.replace('--', '-')
+    # Most field values are plain text: skip pylatexenc entirely for those
+    if _LATEX_MARKER_RE.search(text) is None:
+        return text
+
+    return _clean_latex_cached(text)
+
+# Table-driven conversion of the LaTeX commonly found in bibliographies
+# (accents, escaped characters, font commands, dash and quote ligatures).
+# Every construct in the table converts exactly as pylatexenc converts it;
+# anything else, including font commands pylatexenc has no spec for (such
+# as \texttt, whose argument it drops), is left to pylatexenc (see
+# _simple_latex_to_text).
+_SIMPLE_LATEX_RE = re.compile(r"""
+    \\(?P<escaped>[&%$\#_{}])                                      # \&, \%, ...
+  | \\(?P<symbol_accent>['"`^~=.])(?:\{(?P<sa_letter>[A-Za-z])\}|(?P<sa_bare>[A-Za-z]))
+  | \\(?P<letter_accent>[cvuHrk])(?:\{(?P<la_letter>[A-Za-z])\}|\ +(?P<la_bare>[A-Za-z]))
+  | \\(?:emph|textit|textbf|textrm|textsc|textsl|textnormal)(?=\{)
+  | (?P<ligature>---?|``|'')
+  | (?P<brace>[{}])
+  | (?P<tie>~)
+""", re.VERBOSE)
+
+# Input the table cannot handle: math, comments, alignment tabs,
+# Spanish ligatures and lone backquotes
+_SIMPLE_LATEX_UNSAFE_RE = re.compile(r"(?<!\\)[$%&]|[!?]`|(?<![`\\])`(?!`)")
+_UNESCAPED_BRACE_RE = re.compile(r'(?<!\\)[{}]')
+
+_ACCENTS = {
+    "'": '\u0301', '`': '\u0300', '^': '\u0302', '"': '\u0308', '~': '\u0303',
+    '=': '\u0304', '.': '\u0307', 'c': '\u0327', 'v': '\u030c', 'u': '\u0306',
+    'H': '\u030b', 'r': '\u030a', 'k': '\u0328',
+}
+_LIGATURES = {'---': '\u2014', '--': '\u2013', '``': '\u201c', "''": '\u201d'}
+
+def _replace_simple_latex(match: re.Match[str]) -> str:
+    if match.group('escaped'):
+        return match.group('escaped')
+    if match.group('symbol_accent'):
+        letter = match.group('sa_letter') or match.group('sa_bare')
+        return unicodedata.normalize('NFC', letter + _ACCENTS[match.group('symbol_accent')])
+    if match.group('letter_accent'):
+        letter = match.group('la_letter') or match.group('la_bare')
+        return unicodedata.normalize('NFC', letter + _ACCENTS[match.group('letter_accent')])
+    if match.group('ligature'):
+        return _LIGATURES[match.group('ligature')]
+    if match.group('tie'):
+        return '\u00a0'
+    # Font commands and grouping braces: keep only the enclosed text
+    return ''
+
+def _simple_latex_to_text(text: str) -> str | None:
+    """Convert common LaTeX without pylatexenc, or return None if it can't."""
+    if _SIMPLE_LATEX_UNSAFE_RE.search(text):
+        return None
+
+    # pylatexenc has its own recovery rules for unbalanced groups
+    depth = 0
+    for brace in _UNESCAPED_BRACE_RE.findall(text):
+        depth += 1 if brace == '{' else -1
+        if depth < 0:
+            return None
+    if depth:
+        return None
+
+    converted = _SIMPLE_LATEX_RE.sub(_replace_simple_latex, text)
+
+    # Any backslash left over is a command the table doesn't know
+    if '\\' in converted:
+        return None
+    return converted
+
+# The same journal/publisher/institution strings recur across many entries,
+# so memoize the (expensive) conversion per unique string. This is a plain
+# dict rather than functools.lru_cache so that values converted in bulk by
+# worker processes can be merged in (see _preclean_entries).
+_clean_cache: dict[str, str] = {}
+_CLEAN_CACHE_MAX_SIZE = 1 << 18
+
+def _clean_latex_cached(text: str) -> str:
+    cleaned = _clean_cache.get(text)
+    if cleaned is None:
+        if len(_clean_cache) >= _CLEAN_CACHE_MAX_SIZE:
+            _clean_cache.clear()
+        cleaned = _clean_cache[text] = _convert_latex(text)
+    return cleaned
+
+def _convert_latex(text: str) -> str:
+    # Convert LaTeX to plain text, only parsing with pylatexenc when needed
+    converted = _simple_latex_to_text(text)
+    text = converted if converted is not None else _get_converter().latex_to_text(text)
+
+    # Fix any remaining double dashes to single dash for page ranges. Both
+    # conversions already turn '--' into a dash ligature, so this rarely
+    # applies; test first rather than always calling replace().
+    if '--' in text:
+        text = text.replace('--', '-')
 
     return text
 
-def format_authors(authors_str, max_authors=3):
+def format_authors(authors_str: str | None, max_authors: int = 3) -> str:
     """Format authors with et al. if needed, handling LaTeX-formatted names."""
     if not authors_str:
         return "Unknown Author"
@@ -30,11 +162,12 @@ def format_authors(authors_str, max_authors=3):
     # Clean any LaTeX formatting in author names
     authors_str = clean_latex(authors_str)
 
-    # Split by 'and' - pylatexenc already handles LaTeX 'and' commands
-    authors = [author.strip() for author in authors_str.split(' and ')]
-
-    # Remove empty entries
-    authors = [author for author in authors if author]
+    # Split by 'and' (any surrounding whitespace, including line breaks),
+    # dropping empty entries - pylatexenc already handles LaTeX 'and' commands.
+    # At most max_authors+1 pieces are needed to know whether to use et al.,
+    # so stop splitting there; the last piece then holds all remaining names.
+    authors = [author for author in _AND_RE.split(authors_str.strip(), maxsplit=max_authors)
+               if author]
 
     # Handle case where no authors were found
     if not authors:
@@ -46,7 +179,7 @@ def format_authors(authors_str, max_authors=3):
     else:
         return f"{', '.join(authors[:max_authors-1])}, et al."
 
-def extract_arxiv_info(entry):
+def extract_arxiv_info(entry: Entry) -> tuple[bool, str | None]:
     """Check if an entry is an arXiv preprint and extract information."""
     is_preprint = False
     arxiv_id = None
@@ -54,210 +187,706 @@ def extract_arxiv_info(entry):
     # Fields that might contain arXiv information
     arxiv_fields = ['journal', 'note', 'publisher', 'howpublished', 'url', 'doi']
 
+    get = entry.get
     for field in arxiv_fields:
-        if field in entry and entry[field]:
-            field_text = clean_latex(entry[field]).lower()
+        value = get(field)
+        if value:
+            field_text = clean_latex(value).lower()
 
-            if 'arxiv' in field_text or 'preprint' in field_text:
+            if _ARXIV_MARKER_RE.search(field_text):
                 is_preprint = True
 
-                # Try to extract arXiv ID using common patterns
-                import re
-                patterns = [
-                    r'arxiv:(\d+\.\d+)',
-                    r'arxiv/(\d+\.\d+)',
-                    r'abs/(\d+\.\d+)'
-                ]
-
-                for pattern in patterns:
-                    match = re.search(pattern, field_text, re.IGNORECASE)
-                    if match:
-                        arxiv_id = match.group(1)
-                        break
+                # Try to extract arXiv ID (arxiv:ID, arxiv/ID or abs/ID)
+                match = _ARXIV_RE.search(field_text)
+                if match:
+                    arxiv_id = match.group(1)
 
     return is_preprint, arxiv_id
 
-def format_version_info(entry):
+def format_version_info(entry: Entry) -> str:
     """Format version information for software entries."""
-    version_info = ""
-
-    if 'version' in entry:
-        version_info += f"v{entry['version']}"
+    version = entry.get('version')
+    return "" if version is None else f"v{version}"
+
+# Per-type formatters, each appending the type-specific part of an entry
+
+def _format_article(entry: Entry, parts: list[str]) -> None:
+    get = entry.get
+    journal = get('journal')
+    if journal is not None:
+        volume, number, pages = get('volume'), get('number'), get('pages')
+        parts.append(clean_latex(journal))
+        if volume is not None:
+            parts.append(f", {volume}")
+        if number is not None:
+            parts.append(f"({number})")
+        if pages is not None:
+            parts.append(f", {pages}")
+        parts.append(". ")
+
+def _format_proceedings(entry: Entry, parts: list[str]) -> None:
+    booktitle = entry.get('booktitle')
+    if booktitle is not None:
+        parts.append(f"In: {clean_latex(booktitle)}. ")
+    else:
+        parts.append("In: Unknown Proceedings. ")
 
-    return version_info
+def _format_techreport(entry: Entry, parts: list[str]) -> None:
+    institution = entry.get('institution')
+    if institution is not None:
+        parts.append(f"Technical Report, {clean_latex(institution)}. ")
+    else:
+        parts.append("Technical Report. ")
 
-def bibtex_to_plain(bib_file, max_authors=3, include_abstract=False, include_url=False):
-    """Convert BibTeX to a condensed plain text format using proper LaTeX parsing."""
-    with open(bib_file, 'r', encoding='utf-8') as bibtex_file:
-        # Configure the parser to handle non-standard entry types
-        parser = BibTexParser(common_strings=True)
-        parser.ignore_nonstandard_types = False  # This is the key fix!
+def _format_unpublished(entry: Entry, parts: list[str]) -> None:
+    note = entry.get('note')
+    if note is not None:
+        parts.append(f"{clean_latex(note)}. ")
+    else:
+        parts.append("Unpublished. ")
 
-        bib_database = bibtexparser.load(bibtex_file, parser)
+def _format_book(entry: Entry, parts: list[str]) -> None:
+    get = entry.get
+    publisher, address = get('publisher'), get('address')
+    if publisher is not None:
+        parts.append(f"{clean_latex(publisher)}. ")
 
-    plain_entries = []
+    if address is not None:
+        parts.append(f"{clean_latex(address)}. ")
 
-    for entry in bib_database.entries:
-        # Start with authors and year
-        entry_text = ""
+def _format_software(entry: Entry, parts: list[str]) -> None:
+    get = entry.get
+    url, doi, note = get('url'), get('doi'), get('note')
 
-        # Handle authors
-        if 'author' in entry:
-            entry_text += format_authors(entry['author'], max_authors) + ". "
+    version = format_version_info(entry)
+    if version:
+        parts.append(f"[Software] {version}. ")
+    else:
+        parts.append("[Software]. ")
+
+    if url is not None:
+        parts.append(f"Available at: {clean_latex(url)}. ")
+    elif doi is not None:
+        parts.append(f"DOI: {clean_latex(doi)}. ")
+
+    if note is not None:
+        parts.append(f"{clean_latex(note)}. ")
+
+def _format_dataset(entry: Entry, parts: list[str]) -> None:
+    parts.append("[Dataset]. ")
+    publisher = entry.get('publisher')
+    if publisher is not None:
+        parts.append(f"{clean_latex(publisher)}. ")
+
+def _format_online(entry: Entry, parts: list[str]) -> None:
+    get = entry.get
+    url, note = get('url'), get('note')
+    parts.append("[Online]. ")
+    if url is not None:
+        parts.append(f"Available at: {clean_latex(url)}. ")
+    if note is not None:
+        parts.append(f"{clean_latex(note)}. ")
+
+def _format_other(entry: Entry, parts: list[str]) -> None:
+    """Fallback for any other non-standard type."""
+    # Capitalize the entry type for display
+    display_type = entry['ENTRYTYPE'].capitalize()
+    parts.append(f"[{display_type}]. ")
+
+    # Add whatever additional information we can find
+    get = entry.get
+    for field in ['publisher', 'institution', 'organization', 'howpublished', 'note']:
+        value = get(field)
+        if value is not None:
+            parts.append(f"{clean_latex(value)}. ")
+            break
+
+# Entry type -> formatter; anything not listed goes to _format_other
+_ENTRY_HANDLERS = {
+    # Standard types
+    'article': _format_article,
+    'inproceedings': _format_proceedings,
+    'conference': _format_proceedings,
+    'proceedings': _format_proceedings,
+    'techreport': _format_techreport,
+    'unpublished': _format_unpublished,
+    'book': _format_book,
+    'incollection': _format_book,
+    # Non-standard types
+    'software': _format_software,
+    'dataset': _format_dataset,
+    'online': _format_online,
+}
+
+# Minimal single-pass BibTeX scanner. It yields the same entry shape as
+# bibtexparser (lowercase field names plus 'ENTRYTYPE' and 'ID') at a
+# fraction of the cost of its pyparsing grammar. Field names and entry
+# types are lowercased and interned, so formatting can rely on both.
+
+_ENTRY_HEAD_RE = re.compile(r'@\s*(\w+)\s*([{(])')
+_CITE_KEY_RE = re.compile(r'\s*([^,\s{}()]*)\s*')
+_FIELD_NAME_RE = re.compile(r'\s*([^\s=,{}()"#]+)\s*=\s*')
+_BARE_VALUE_RE = re.compile(r'[^\s,#{}()"]+')
+_WHITESPACE_RE = re.compile(r'\s*')
+_NEWLINE_INDENT_RE = re.compile(r'\n[^\S\n]*')
+
+# Month macros predefined by BibTeX styles (bibtexparser's common_strings)
+_COMMON_STRINGS = {
+    'jan': 'January', 'feb': 'February', 'mar': 'March', 'apr': 'April',
+    'may': 'May', 'jun': 'June', 'jul': 'July', 'aug': 'August',
+    'sep': 'September', 'oct': 'October', 'nov': 'November', 'dec': 'December',
+}
+
+def _skip_whitespace(text: str, pos: int) -> int:
+    match = _WHITESPACE_RE.match(text, pos)
+    assert match is not None  # \s* always matches
+    return match.end()
+
+def _find_group_end(text: str, pos: int, closer: str = '}') -> int:
+    """Return the index of the delimiter closing the group opened at text[pos]."""
+    depth = 0
+    for i in range(pos + 1, len(text)):
+        c = text[i]
+        if c == '{':
+            depth += 1
+        elif c == '}':
+            if depth == 0 and closer == '}':
+                return i
+            depth -= 1
+        elif c == closer and depth == 0:
+            return i
+    raise ValueError(f"Unbalanced braces starting at offset {pos}")
+
+def _parse_value(text: str, pos: int, strings: dict[str, str]) -> tuple[str, int]:
+    """Parse a (possibly '#'-concatenated) field value starting at text[pos]."""
+    pieces = []
+    while True:
+        c = text[pos:pos + 1]
+        if c == '{':
+            end = _find_group_end(text, pos)
+            pieces.append(text[pos + 1:end])
+            pos = end + 1
+        elif c == '"':
+            end = _find_group_end(text, pos, closer='"')
+            pieces.append(text[pos + 1:end])
+            pos = end + 1
         else:
-            # Handle edge cases like committee reports
-            if 'editor' in entry:
-                entry_text += format_authors(entry['editor'], max_authors) + " (Eds.). "
+            match = _BARE_VALUE_RE.match(text, pos)
+            if not match:
+                raise ValueError(f"Missing field value at offset {pos}")
+            token = match.group(0)
+            pieces.append(token if token.isdigit() else strings.get(token.lower(), token))
+            pos = match.end()
+
+        pos = _skip_whitespace(text, pos)
+        if text[pos:pos + 1] != '#':
+            break
+        pos = _skip_whitespace(text, pos + 1)
+
+    # Like bibtexparser, drop the indentation of continuation lines
+    return _NEWLINE_INDENT_RE.sub('\n', ''.join(pieces)), pos
+
+def _parse_fields(text: str, pos: int, closer: str,
+                  strings: dict[str, str]) -> tuple[Entry, int]:
+    """Parse 'name = value' pairs up to the closing delimiter of the entry."""
+    fields: Entry = {}
+    while True:
+        pos = _skip_whitespace(text, pos)
+        if pos >= len(text):
+            raise ValueError("Unexpected end of file inside an entry")
+        if text[pos] == closer:
+            return fields, pos + 1
+
+        match = _FIELD_NAME_RE.match(text, pos)
+        if not match:
+            raise ValueError(f"Malformed field at offset {pos}")
+        value, pos = _parse_value(text, match.end(), strings)
+        # Field names repeat across every entry; interned names make the
+        # formatters' lookups with literal keys hit dict's identity fast path.
+        # Like bibtexparser, the first occurrence of a duplicate field wins.
+        fields.setdefault(sys.intern(match.group(1).lower()), value)
+
+        if text[pos:pos + 1] == ',':
+            pos += 1
+
+def parse_bibtex(text: str) -> list[Entry]:
+    """Parse BibTeX source into a list of entry dicts.
+
+    @string macros (and the usual month abbreviations) are expanded,
+    @comment and @preamble blocks are skipped, and malformed entries are
+    dropped rather than aborting the whole file.
+    """
+    strings = dict(_COMMON_STRINGS)
+    entries: list[Entry] = []
+    pos = 0
+
+    while True:
+        head = _ENTRY_HEAD_RE.search(text, pos)
+        if head is None:
+            return entries
+
+        # Outside entries, '%' comments out the rest of the line, which is
+        # how entries are commonly disabled
+        line_start = max(text.rfind('\n', pos, head.start()) + 1, pos)
+        if '%' in text[line_start:head.start()]:
+            line_end = text.find('\n', head.start())
+            if line_end == -1:
+                return entries
+            pos = line_end + 1
+            continue
+
+        entry_type = sys.intern(head.group(1).lower())
+        opener = head.start(2)
+        closer = '}' if head.group(2) == '{' else ')'
+        pos = head.end()
+
+        try:
+            if entry_type in ('comment', 'preamble'):
+                pos = _find_group_end(text, opener, closer) + 1
+            elif entry_type == 'string':
+                fields, pos = _parse_fields(text, pos, closer, strings)
+                strings.update(fields)
             else:
-                # Try to extract organization from different fields
-                org = None
-                for field in ['organization', 'institution', 'publisher']:
-                    if field in entry:
-                        org = entry[field]
-                        break
-
-                if org:
-                    entry_text += f"{clean_latex(org)}. "
-                else:
-                    entry_text += "Unknown Author. "
-
-        # Add year
-        if 'year' in entry:
-            entry_text += f"({entry['year']}) "
-        else:
-            entry_text += "(Unknown Year) "
-
-        # Add title
-        if 'title' in entry:
-            entry_text += f"{clean_latex(entry['title'])}. "
+                key = _CITE_KEY_RE.match(text, pos)
+                assert key is not None  # every part of the pattern is optional
+                pos = key.end()
+                if text[pos:pos + 1] == ',':
+                    pos += 1
+                fields, pos = _parse_fields(text, pos, closer, strings)
+                # Entries without any field carry nothing worth printing
+                if fields:
+                    fields['ENTRYTYPE'] = entry_type
+                    fields['ID'] = key.group(1)
+                    entries.append(fields)
+        except ValueError:
+            # Skip the broken entry and resume scanning after its header
+            pos = head.end()
+
+def _format_entry(entry: Entry, max_authors: int, include_abstract: bool,
+                  include_url: bool) -> str:
+    """Format a single parsed entry as plain text."""
+    # Look up the common fields once; None means the field is absent
+    get = entry.get
+    author, editor = get('author'), get('editor')
+    year, title = get('year'), get('title')
+    url, doi = get('url'), get('doi')
+
+    # Start with authors and year
+    parts = []
+
+    # Handle authors
+    if author is not None:
+        parts.append(format_authors(author, max_authors) + ". ")
+    else:
+        # Handle edge cases like committee reports
+        if editor is not None:
+            parts.append(format_authors(editor, max_authors) + " (Eds.). ")
         else:
-            entry_text += "Untitled. "
-
-        # Handle different entry types
-        entry_type = entry['ENTRYTYPE'].lower()
-
-        # Standard types
-        if entry_type == 'article':
-            if 'journal' in entry:
-                entry_text += f"{clean_latex(entry['journal'])}"
-                if 'volume' in entry:
-                    entry_text += f", {entry['volume']}"
-                if 'number' in entry:
-                    entry_text += f"({entry['number']})"
-                if 'pages' in entry:
-                    entry_text += f", {entry['pages']}"
-                entry_text += ". "
-
-        elif entry_type in ['inproceedings', 'conference', 'proceedings']:
-            if 'booktitle' in entry:
-                entry_text += f"In: {clean_latex(entry['booktitle'])}. "
-            else:
-                entry_text += "In: Unknown Proceedings. "
-
-        elif entry_type == 'techreport':
-            if 'institution' in entry:
-                entry_text += f"Technical Report, {clean_latex(entry['institution'])}. "
-            else:
-                entry_text += "Technical Report. "
+            # Try to extract organization from different fields
+            org = None
+            for field in ['organization', 'institution', 'publisher']:
+                org = get(field)
+                if org is not None:
+                    break
 
-        elif entry_type == 'unpublished':
-            if 'note' in entry:
-                entry_text += f"{clean_latex(entry['note'])}. "
+            if org:
+                parts.append(f"{clean_latex(org)}. ")
             else:
-                entry_text += "Unpublished. "
-
-        elif entry_type in ['book', 'incollection']:
-            if 'publisher' in entry:
-                entry_text += f"{clean_latex(entry['publisher'])}. "
+                parts.append("Unknown Author. ")
 
-            if 'address' in entry:
-                entry_text += f"{clean_latex(entry['address'])}. "
+    # Add year
+    if year is not None:
+        parts.append(f"({year}) ")
+    else:
+        parts.append("(Unknown Year) ")
 
-        # Non-standard types
-        elif entry_type == 'software':
-            # Handle software entries
-            version = format_version_info(entry)
-            if version:
-                entry_text += f"[Software] {version}. "
-            else:
-                entry_text += "[Software]. "
-
-            if 'url' in entry or 'doi' in entry:
-                if 'url' in entry:
-                    entry_text += f"Available at: {clean_latex(entry['url'])}. "
-                elif 'doi' in entry:
-                    entry_text += f"DOI: {clean_latex(entry['doi'])}. "
-
-            if 'note' in entry:
-                entry_text += f"{clean_latex(entry['note'])}. "
-
-        elif entry_type == 'dataset':
-            entry_text += "[Dataset]. "
-            if 'publisher' in entry:
-                entry_text += f"{clean_latex(entry['publisher'])}. "
-
-        elif entry_type == 'online':
-            entry_text += "[Online]. "
-            if 'url' in entry:
-                entry_text += f"Available at: {clean_latex(entry['url'])}. "
-            if 'note' in entry:
-                entry_text += f"{clean_latex(entry['note'])}. "
-
-        # Fallback for any other non-standard type
+    # Add title
+    if title is not None:
+        parts.append(f"{clean_latex(title)}. ")
+    else:
+        parts.append("Untitled. ")
+
+    # Handle different entry types
+    entry_type = entry['ENTRYTYPE']
+    _ENTRY_HANDLERS.get(entry_type, _format_other)(entry, parts)
+
+    # Check if it's a preprint
+    is_preprint, arxiv_id = extract_arxiv_info(entry)
+
+    if is_preprint:
+        parts.append("[Preprint] ")
+        if arxiv_id:
+            parts.append(f"arXiv:{arxiv_id} ")
+
+    # Add URL if requested and not already included
+    entry_text = "".join(parts)
+    if include_url and 'url' not in entry_text:
+        if url is not None:
+            parts.append(f"URL: {clean_latex(url)} ")
+        elif doi is not None:
+            parts.append(f"DOI: {clean_latex(doi)} ")
+
+    # Add abstract if requested
+    if include_abstract:
+        abstract = get('abstract')
+        if abstract is not None:
+            parts.append(f"Abstract: {clean_latex(abstract)}")
+
+    return "".join(parts).strip()
+
+# Fields whose value goes through clean_latex when formatting any entry.
+# 'address' (books only) and 'abstract' (--include-abstract only) are
+# added per entry by _preclean_entries, so it never converts values that
+# won't be printed.
+_LATEX_FIELDS = (
+    'author', 'editor', 'organization', 'institution', 'publisher', 'title',
+    'journal', 'booktitle', 'note', 'url', 'doi', 'howpublished',
+)
+_BOOK_LATEX_FIELDS = _LATEX_FIELDS + ('address',)
+
+# Spinning up worker processes only pays off with plenty of values to convert
+_PARALLEL_MIN_VALUES = 1000
+_PARALLEL_CHUNK_SIZE = 250
+
+def _preclean_entries(entries: list[Entry], jobs: int,
+                      include_abstract: bool = False) -> None:
+    """Convert the distinct LaTeX field values of all entries up front.
+
+    Each value that actually needs converting is collected once and the
+    batch is spread across `jobs` worker processes. The results land in
+    _clean_cache, so formatting the entries afterwards only does lookups.
+    Small batches are left to be converted lazily in-process. Only fields
+    the formatter reads are converted: abstracts only with include_abstract.
+    """
+    pending = set()
+    for entry in entries:
+        get = entry.get
+        fields: tuple[str, ...]
+        if _ENTRY_HANDLERS.get(entry['ENTRYTYPE']) is _format_book:
+            fields = _BOOK_LATEX_FIELDS
         else:
-            # Capitalize the entry type for display
-            display_type = entry_type.capitalize()
-            entry_text += f"[{display_type}]. "
-
-            # Add whatever additional information we can find
-            for field in ['publisher', 'institution', 'organization', 'howpublished', 'note']:
-                if field in entry:
-                    entry_text += f"{clean_latex(entry[field])}. "
-                    break
-
-        # Check if it's a preprint
-        is_preprint, arxiv_id = extract_arxiv_info(entry)
-
-        if is_preprint:
-            entry_text += "[Preprint] "
-            if arxiv_id:
-                entry_text += f"arXiv:{arxiv_id} "
-
-        # Add URL if requested and not already included
-        if include_url and 'url' not in entry_text:
-            if 'url' in entry:
-                entry_text += f"URL: {clean_latex(entry['url'])} "
-            elif 'doi' in entry:
-                entry_text += f"DOI: {clean_latex(entry['doi'])} "
-
-        # Add abstract if requested
-        if include_abstract and 'abstract' in entry:
-            entry_text += f"Abstract: {clean_latex(entry['abstract'])}"
+            fields = _LATEX_FIELDS
+        if include_abstract:
+            fields += ('abstract',)
+        for field in fields:
+            value = get(field)
+            if value and value not in _clean_cache and _LATEX_MARKER_RE.search(value):
+                pending.add(value)
+
+    if len(pending) < _PARALLEL_MIN_VALUES:
+        return
+
+    values = list(pending)
+    from concurrent.futures import ProcessPoolExecutor
+    with ProcessPoolExecutor(max_workers=jobs) as executor:
+        converted = executor.map(_convert_latex, values, chunksize=_PARALLEL_CHUNK_SIZE)
+        _clean_cache.update(zip(values, converted))
+
+# Results of previous runs, keyed by input file and formatting options.
+# Bump _CACHE_VERSION whenever the output format changes.
+_CACHE_VERSION = 3
+
+def _cache_dir() -> str:
+    base = os.environ.get('XDG_CACHE_HOME') or os.path.expanduser('~/.cache')
+    return os.path.join(base, 'bib2txt')
+
+def _cache_path(bib_file: str, options: tuple[object, ...]) -> str:
+    """One cache file per (input path, options), overwritten when the input changes."""
+    key = repr((os.path.abspath(bib_file), options)).encode('utf-8')
+    return os.path.join(_cache_dir(), f"{hashlib.sha1(key).hexdigest()}.pkl")
+
+def _file_fingerprint(bibtex_file: BinaryIO) -> tuple[object, ...] | None:
+    """Cheap change detection: mtime, size and a hash of the first 4 KB.
+
+    Returns None for anything but a regular file: pipes and the like can
+    only be read once, and have no stable identity to cache under anyway.
+    """
+    stat = os.fstat(bibtex_file.fileno())
+    if not S_ISREG(stat.st_mode):
+        return None
+
+    head_hash = hashlib.sha1(bibtex_file.read(4096)).hexdigest()
+    bibtex_file.seek(0)
+    return (_CACHE_VERSION, stat.st_mtime_ns, stat.st_size, head_hash)
+
+def _load_cached(cache_path: str, fingerprint: tuple[object, ...]) -> list[str] | None:
+    try:
+        with open(cache_path, 'rb') as f:
+            cached_fingerprint, plain_entries = pickle.load(f)
+    except (OSError, pickle.UnpicklingError, EOFError, ValueError, TypeError):
+        return None
+
+    return plain_entries if cached_fingerprint == fingerprint else None
+
+def _store_cached(cache_path: str, fingerprint: tuple[object, ...],
+                  plain_entries: list[str]) -> None:
+    # Caching is best-effort: an unwritable cache directory is not an error
+    try:
+        os.makedirs(os.path.dirname(cache_path), exist_ok=True)
+        tmp_path = f"{cache_path}.{os.getpid()}.tmp"
+        with open(tmp_path, 'wb') as f:
+            pickle.dump((fingerprint, plain_entries), f, protocol=pickle.HIGHEST_PROTOCOL)
+        os.replace(tmp_path, cache_path)
+    except OSError:
+        pass
+
+def _read_bib_text(bibtex_file: BinaryIO) -> str:
+    """Read an open .bib file as text, mapping it into memory in one go."""
+    try:
+        with mmap.mmap(bibtex_file.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+            data = mapped[:]
+    except (ValueError, OSError):
+        # Empty files and non-regular files (pipes, ...) cannot be mapped
+        data = bibtex_file.read()
+
+    text = data.decode('utf-8')
+
+    # Same newline handling as reading in text mode
+    if '\r' in text:
+        text = text.replace('\r\n', '\n').replace('\r', '\n')
+    return text
 
-        plain_entries.append(entry_text.strip())
+def _format_entries(entries: list[Entry], max_authors: int, include_abstract: bool,
+                    include_url: bool, jobs: int | None) -> Iterator[str]:
+    """Yield the formatted entries in input order.
 
-    return "\n\n".join(plain_entries)
+    jobs=None means one worker process per CPU.
+    """
+    workers = jobs or os.cpu_count() or 1
+    if workers > 1:
+        _preclean_entries(entries, workers, include_abstract)
+
+    for entry in entries:
+        yield _format_entry(entry, max_authors, include_abstract, include_url)
+
+# Characters ignored when sorting on raw (unconverted) author names
+_SORT_NOISE_RE = re.compile(r'[{}\\\'"`^~]')
+
+def _year_sort_key(entry: Entry) -> tuple[bool, str]:
+    year = entry.get('year')
+    # Entries without a year go last
+    return (year is None, year or '')
+
+def _author_sort_key(entry: Entry) -> tuple[bool, str]:
+    names = entry.get('author') or entry.get('editor')
+    # Compare the raw field with LaTeX accents and braces stripped, which is
+    # close enough for ordering and avoids converting entries up front
+    return (names is None, _SORT_NOISE_RE.sub('', names or '').lower())
+
+_SORT_KEYS: dict[str, Callable[[Entry], tuple[bool, str]]] = {'year': _year_sort_key, 'author': _author_sort_key}
+
+def _select_entries(entries: list[Entry], sorting: str, key: str | None) -> list[Entry]:
+    """Filter on citation key and sort, before any LaTeX gets converted."""
+    if key is not None:
+        entries = [entry for entry in entries if entry['ID'] == key]
+
+    if sorting in _SORT_KEYS:
+        # Stable, so entries with equal keys keep their file order
+        entries.sort(key=_SORT_KEYS[sorting])
+
+    return entries
+
+def _with_separators(texts: Iterable[str]) -> Iterator[str]:
+    """Yield the texts with a blank line between consecutive ones."""
+    for i, text in enumerate(texts):
+        if i:
+            yield "\n\n"
+        yield text
+
+def _collect(texts: Iterable[str], sink: list[str]) -> Iterator[str]:
+    """Pass the texts through, appending each one to sink on the way."""
+    for text in texts:
+        sink.append(text)
+        yield text
+
+def iter_bibtex_to_plain(bib_file: str, max_authors: int = 3, include_abstract: bool = False,
+                         include_url: bool = False, sorting: str = 'none', key: str | None = None,
+                         jobs: int | None = 1, use_cache: bool = True) -> Iterator[str]:
+    """Generate the output of bibtex_to_plain piece by piece.
+
+    Each formatted entry is yielded as soon as it is ready, with the blank
+    lines between entries yielded separately, so callers can write the
+    result out without joining it into one string. The input is read and
+    parsed before the first chunk is yielded. When the result is cached
+    (use_cache, regular input files, no key), the formatted entries are
+    also kept in a list until the end, since that list is what gets cached.
+    """
+    if jobs is not None and jobs < 1:
+        raise ValueError(f"jobs must be at least 1, got {jobs}")
+
+    # The input is opened once: it may be a pipe, which can't be read twice
+    cache: tuple[str, tuple[object, ...]] | None = None
+    cached_entries: list[str] | None = None
+    text = ""
+    # Runs selecting a single key are not cached: each key would get its
+    # own cache file, and nothing would ever remove them
+    use_cache = use_cache and key is None
+    with open(bib_file, 'rb') as bibtex_file:
+        fingerprint = _file_fingerprint(bibtex_file) if use_cache else None
+        if fingerprint is not None:
+            options = (max_authors, include_abstract, include_url, sorting)
+            cache = (_cache_path(bib_file, options), fingerprint)
+            cached_entries = _load_cached(*cache)
+        if cached_entries is None:
+            text = _read_bib_text(bibtex_file)
+
+    if cached_entries is not None:
+        yield from _with_separators(cached_entries)
+        return
+
+    entries = _select_entries(parse_bibtex(text), sorting, key)
+    formatted = _format_entries(entries, max_authors, include_abstract, include_url, jobs)
+
+    if cache is None:
+        yield from _with_separators(formatted)
+        return
+
+    # The cache needs every formatted entry, so keep them as they stream by
+    plain_entries: list[str] = []
+    yield from _with_separators(_collect(formatted, plain_entries))
+    _store_cached(*cache, plain_entries)
+
+def bibtex_to_plain(bib_file: str, max_authors: int = 3, include_abstract: bool = False,
+                    include_url: bool = False, sorting: str = 'none', key: str | None = None,
+                    jobs: int | None = 1, use_cache: bool = True) -> str:
+    """Convert BibTeX to a condensed plain text format using proper LaTeX parsing.
+
+    Entries are sorted by 'year' or 'author' if requested (default: file
+    order), and restricted to the entry with citation key `key` if given.
+    With jobs > 1, or jobs=None for one per CPU, LaTeX in large
+    bibliographies is converted across that many worker processes; the
+    default, jobs=1, stays in-process.
+    Results are cached on disk (see _cache_dir) unless use_cache is False.
+    """
+    return "".join(iter_bibtex_to_plain(bib_file,
+                                        max_authors=max_authors,
+                                        include_abstract=include_abstract,
+                                        include_url=include_url,
+                                        sorting=sorting,
+                                        key=key,
+                                        jobs=jobs,
+                                        use_cache=use_cache))
+
+def _positive_int(value: str) -> int:
+    number = int(value)
+    if number < 1:
+        raise ValueError(f"expected a positive integer, got {value!r}")
+    return number
+
+def _build_arg_parser() -> argparse.ArgumentParser:
+    import argparse
+
+    def positive_int(value: str) -> int:
+        try:
+            return _positive_int(value)
+        except ValueError:
+            raise argparse.ArgumentTypeError(f"expected a positive integer, got {value!r}")
 
-if __name__ == "__main__":
     parser = argparse.ArgumentParser(description='Convert BibTeX to plain text for LLMs')
     parser.add_argument('input', help='Input BibTeX file')
     parser.add_argument('--output', help='Output plain text file (optional)')
     parser.add_argument('--max-authors', type=int, default=3, help='Maximum number of authors before using et al.')
     parser.add_argument('--include-abstract', action='store_true', help='Include abstracts in the output')
     parser.add_argument('--include-url', action='store_true', help='Include URLs in the output')
-    parser.add_argument('--sorting', choices=['none', 'year', 'author'], default='none',
+    parser.add_argument('--jobs', type=positive_int, default=None,
+                       help='Worker processes for converting LaTeX in large files (default: one per CPU)')
+    parser.add_argument('--no-cache', action='store_true',
+                       help='Do not read or write the on-disk result cache')
+    parser.add_argument('--sorting', choices=_SORTING_CHOICES, default='none',
                        help='Sort entries by year, first author, or leave as is (default: none)')
+    parser.add_argument('--key', default=None,
+                       help='Only output the entry with this citation key')
+    return parser
+
+# Command-line options understood by the parse_args fast path; these must
+# stay in sync with _build_arg_parser, including defaults
+_SORTING_CHOICES = ['none', 'year', 'author']
+_FLAG_OPTIONS = {
+    '--include-abstract': 'include_abstract',
+    '--include-url': 'include_url',
+    '--no-cache': 'no_cache',
+}
+_VALUE_OPTIONS: dict[str, tuple[str, Callable[[str], object]]] = {
+    '--output': ('output', str),
+    '--max-authors': ('max_authors', int),
+    '--jobs': ('jobs', _positive_int),
+    '--sorting': ('sorting', str),
+    '--key': ('key', str),
+}
+
+def _parse_args_fully(argv: list[str]) -> SimpleNamespace:
+    return SimpleNamespace(**vars(_build_arg_parser().parse_args(argv)))
+
+def parse_args(argv: list[str]) -> SimpleNamespace:
+    """Parse command-line arguments.
+
+    Plain, well-formed command lines are handled directly so that argparse
+    never has to be imported. Help requests and anything else (option
+    abbreviations, --opt=value, errors) go through argparse so that its
+    usage and error messages are unchanged.
+    """
+    args: dict[str, object] = {
+        'input': None,
+        'output': None,
+        'max_authors': 3,
+        'include_abstract': False,
+        'include_url': False,
+        'jobs': None,
+        'no_cache': False,
+        'sorting': 'none',
+        'key': None,
+    }
+
+    i = 0
+    while i < len(argv):
+        arg = argv[i]
+        if arg in _FLAG_OPTIONS:
+            args[_FLAG_OPTIONS[arg]] = True
+        elif arg in _VALUE_OPTIONS and i + 1 < len(argv) and not argv[i + 1].startswith('-'):
+            dest, convert = _VALUE_OPTIONS[arg]
+            try:
+                args[dest] = convert(argv[i + 1])
+            except ValueError:
+                return _parse_args_fully(argv)
+            i += 1
+        elif not arg.startswith('-') and args['input'] is None:
+            args['input'] = arg
+        else:
+            return _parse_args_fully(argv)
+        i += 1
 
-    args = parser.parse_args()
+    if args['input'] is None or args['sorting'] not in _SORTING_CHOICES:
+        return _parse_args_fully(argv)
 
-    result = bibtex_to_plain(args.input,
-                             max_authors=args.max_authors,
-                             include_abstract=args.include_abstract,
-                             include_url=args.include_url)
+    return SimpleNamespace(**args)
+
+def main(argv: list[str] | None = None) -> None:
+    args = parse_args(sys.argv[1:] if argv is None else argv)
+
+    # Write entries out as they are produced rather than joining them first
+    chunks = iter_bibtex_to_plain(args.input,
+                                  max_authors=args.max_authors,
+                                  include_abstract=args.include_abstract,
+                                  include_url=args.include_url,
+                                  sorting=args.sorting,
+                                  key=args.key,
+                                  jobs=args.jobs,
+                                  use_cache=not args.no_cache)
+
+    # Reading and parsing the input all happen before the first chunk is
+    # produced, so get it before touching the output: a missing or
+    # undecodable input must not truncate an existing output file
+    first_chunk = next(chunks, "")
 
     if args.output:
         with open(args.output, 'w', encoding='utf-8') as f:
-            f.write(result)
+            f.write(first_chunk)
+            f.writelines(chunks)
         print(f"Converted bibliography written to {args.output}")
     else:
-        print(result)
+        sys.stdout.write(first_chunk)
+        sys.stdout.writelines(chunks)
+        sys.stdout.write("\n")
+
+if __name__ == "__main__":
+    main()
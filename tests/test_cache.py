@@ -0,0 +1,60 @@
+"""On-disk result cache: hits, invalidation and non-regular inputs."""
+import os
+
+import pytest
+
+import main
+
+BIB = "@article{k1, author = {A. One}, title = {First}, year = {2001}}\n"
+
+
+@pytest.fixture(autouse=True)
+def cache_home(tmp_path, monkeypatch):
+    monkeypatch.setenv('XDG_CACHE_HOME', str(tmp_path / 'cache'))
+    return tmp_path / 'cache'
+
+
+def test_second_run_is_served_from_cache(tmp_path, cache_home):
+    bib = tmp_path / 'refs.bib'
+    bib.write_text(BIB)
+    first = main.bibtex_to_plain(str(bib))
+    assert len(list((cache_home / 'bib2txt').iterdir())) == 1
+    assert main.bibtex_to_plain(str(bib)) == first
+
+
+def test_key_runs_are_not_cached(tmp_path, cache_home):
+    bib = tmp_path / 'refs.bib'
+    bib.write_text(BIB + BIB.replace('k1', 'k2').replace('First', 'Second'))
+    assert main.bibtex_to_plain(str(bib), key='k2') == "A. One. (2001) Second."
+    assert not (cache_home / 'bib2txt').exists()
+
+
+def test_changed_file_is_reformatted(tmp_path):
+    bib = tmp_path / 'refs.bib'
+    bib.write_text(BIB)
+    main.bibtex_to_plain(str(bib))
+    bib.write_text(BIB.replace('First', 'Second') + "\n")
+    assert 'Second' in main.bibtex_to_plain(str(bib))
+
+
+@pytest.mark.skipif(not hasattr(os, 'fork'), reason="needs fork and /dev/fd")
+def test_pipes_are_read_once_and_not_cached(cache_home):
+    # Larger than the 4 KB the fingerprint looks at
+    text = "".join(f"@misc{{k{i}, title = {{Entry {i}}}}}\n" for i in range(200))
+    read_fd, write_fd = os.pipe()
+    pid = os.fork()
+    if pid == 0:
+        os.close(read_fd)
+        with os.fdopen(write_fd, 'w') as pipe:
+            pipe.write(text)
+        os._exit(0)
+
+    os.close(write_fd)
+    try:
+        result = main.bibtex_to_plain(f"/dev/fd/{read_fd}")
+    finally:
+        os.close(read_fd)
+        os.waitpid(pid, 0)
+
+    assert result.count("Entry ") == 200
+    assert not (cache_home / 'bib2txt').exists()
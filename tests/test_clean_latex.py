@@ -0,0 +1,15 @@
+"""clean_latex: the table-driven fast path must agree with pylatexenc."""
+import pytest
+from pylatexenc.latex2text import LatexNodes2Text
+
+from main import clean_latex
+
+
+@pytest.mark.parametrize('text', [
+    r"Caf\'e \"{o} \c{c} \v s",
+    r"\emph{Deep} \textbf{Learning} \textsc{Nets}",
+    r"\texttt{code} \textsf{sans} \textup{up} \textmd{md} tail",
+    r"pages 1--10, ``quoted'' --- aside, A\&B 50\%",
+])
+def test_matches_pylatexenc(text):
+    assert clean_latex(text) == LatexNodes2Text().latex_to_text(text).replace('--', '-')
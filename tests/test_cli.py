@@ -0,0 +1,29 @@
+"""Command line: the argv fast path, its argparse fallback and output handling."""
+import pytest
+
+from main import main, parse_args
+
+
+def test_fast_path_parses_common_options():
+    args = parse_args(['refs.bib', '--output', 'out.txt', '--include-url', '--jobs', '2'])
+    assert (args.input, args.output, args.include_url, args.jobs) == ('refs.bib', 'out.txt', True, 2)
+    assert (args.max_authors, args.sorting, args.key) == (3, 'none', None)
+
+
+@pytest.mark.parametrize('jobs', ['0', '-1', 'many'])
+def test_jobs_must_be_positive(jobs, capsys):
+    with pytest.raises(SystemExit):
+        parse_args(['refs.bib', '--jobs', jobs])
+    assert '--jobs' in capsys.readouterr().err
+
+
+def test_bad_input_leaves_existing_output_alone(tmp_path):
+    out = tmp_path / 'out.txt'
+    out.write_text('previous run\n')
+    bad = tmp_path / 'bad.bib'
+    bad.write_bytes(b'@misc{a, title = {\xff}}\n')
+    with pytest.raises(FileNotFoundError):
+        main([str(tmp_path / 'missing.bib'), '--output', str(out), '--no-cache'])
+    with pytest.raises(UnicodeDecodeError):
+        main([str(bad), '--output', str(out), '--no-cache'])
+    assert out.read_text() == 'previous run\n'
@@ -0,0 +1,56 @@
+"""Formatting entries: author lists, arXiv detection and worker processes."""
+import pytest
+
+import main
+from main import extract_arxiv_info, format_authors
+
+HEAVY = "".join(f"@misc{{k{i}, title = {{Caf\\'e {i}}}}}\n" for i in range(1500))
+
+
+def test_library_calls_stay_in_process(tmp_path, monkeypatch):
+    def no_pool(*args, **kwargs):
+        raise AssertionError("worker pool started")
+    monkeypatch.setattr(main, '_preclean_entries', no_pool)
+    bib = tmp_path / 'heavy.bib'
+    bib.write_text(HEAVY)
+    assert main.bibtex_to_plain(str(bib), use_cache=False).count('Café') == 1500
+
+
+@pytest.mark.parametrize('authors', ["A. One\nand B. Two", "A. One  and\tB. Two", "A. One and\n  B. Two"])
+def test_authors_split_on_any_whitespace_around_and(authors):
+    assert format_authors(authors) == "A. One, B. Two"
+
+
+def test_et_al_only_beyond_max_authors():
+    assert format_authors("A and B and C", max_authors=3) == "A, B, C"
+    assert format_authors("A and B and C and D", max_authors=3) == "A, B, et al."
+    assert format_authors("A and B", max_authors=2) == "A, B"
+    assert format_authors("A and B and C", max_authors=2) == "A, et al."
+
+
+def _format_authors_full_split(authors_str, max_authors):
+    authors = [a for a in main._AND_RE.split(main.clean_latex(authors_str).strip()) if a]
+    if len(authors) <= max_authors:
+        return ', '.join(authors)
+    return f"{', '.join(authors[:max_authors-1])}, et al."
+
+
+@pytest.mark.parametrize('max_authors', [1, 2, 3, 5, 40, 41, 60])
+def test_long_author_list_matches_full_split(max_authors):
+    authors = " and\n ".join(f"M\\\"uller, A{i}." for i in range(40))
+    assert format_authors(authors, max_authors) == _format_authors_full_split(authors, max_authors)
+
+
+@pytest.mark.parametrize('fields, expected', [
+    ({'journal': 'arXiv preprint arXiv:2101.00001'}, (True, '2101.00001')),
+    ({'url': 'https://arxiv.org/abs/1905.12345v2'}, (True, '1905.12345')),
+    ({'eprint': 'x', 'note': 'ArXiv/1801.00002'}, (True, '1801.00002')),
+    ({'howpublished': 'Preprint'}, (True, None)),
+    ({'journal': 'Nature', 'doi': '10.1038/abs/1234.5678'}, (False, None)),
+    # The leftmost ID in a field wins, whatever its prefix
+    ({'note': 'abs/1111.1111, see also arxiv:2222.2222'}, (True, '1111.1111')),
+    # A later field overrides an earlier one
+    ({'journal': 'arXiv:1111.1111', 'url': 'https://arxiv.org/abs/2222.2222'}, (True, '2222.2222')),
+])
+def test_extract_arxiv_info(fields, expected):
+    assert extract_arxiv_info({'ENTRYTYPE': 'misc', 'ID': 'k', **fields}) == expected
@@ -0,0 +1,67 @@
+"""Regression checks for the BibTeX scanner against bibtexparser 1.x behaviour."""
+from main import parse_bibtex
+
+
+def test_basic_entry_shape():
+    entries = parse_bibtex("@Article{Key1, AUTHOR = {A. One and B. Two}, Year = 2001}")
+    assert entries == [{'author': 'A. One and B. Two', 'year': '2001',
+                        'ENTRYTYPE': 'article', 'ID': 'Key1'}]
+
+
+def test_strings_months_and_concatenation():
+    entries = parse_bibtex('''
+        @String{ACM = "Association for {C}omputing Machinery"}
+        @STRING(foo = {Foo} # " Press")
+        @book{k, journal = acm, month = feb, publisher = foo # { Ltd}}
+    ''')
+    assert entries[0]['journal'] == 'Association for {C}omputing Machinery'
+    assert entries[0]['month'] == 'February'
+    assert entries[0]['publisher'] == 'Foo Press Ltd'
+
+
+def test_quoted_and_nested_values():
+    entries = parse_bibtex('@misc{k, title = "A {"}quoted{"} title with {nested {braces}}"}')
+    assert entries[0]['title'] == 'A {"}quoted{"} title with {nested {braces}}'
+
+
+def test_continuation_lines_lose_indentation():
+    entries = parse_bibtex('''@misc{k, note = {Line one
+                   line two
+
+                   para}}''')
+    assert entries[0]['note'] == 'Line one\nline two\n\npara'
+
+
+def test_comment_preamble_and_paren_entries():
+    entries = parse_bibtex('''
+        @comment{ignore {nested} this @article{x, title={no}} }
+        @preamble{ "\\newcommand{\\x}{y}" }
+        @misc(k, title = {Paren entry}, year = {2002})
+    ''')
+    assert [e['ID'] for e in entries] == ['k']
+    assert entries[0]['title'] == 'Paren entry'
+
+
+def test_percent_commented_entries_are_skipped():
+    entries = parse_bibtex('''
+        % @article{fake, title={no}}
+          %@misc{fake2,
+          title={no}}
+        @misc{real, title={x}, note = {100% sure}} % @misc{trail, title={y}}
+    ''')
+    assert [e['ID'] for e in entries] == ['real']
+    assert entries[0]['note'] == '100% sure'
+
+
+def test_duplicate_fields_keep_first_value():
+    entries = parse_bibtex("@article{k, title={First}, TITLE={Second}}")
+    assert entries[0]['title'] == 'First'
+
+
+def test_empty_and_malformed_entries():
+    entries = parse_bibtex('''
+        @misc{empty}
+        @misc{broken, title = {unbalanced}
+        @misc{ok, title = {fine}}
+    ''')
+    assert [e['ID'] for e in entries] == ['ok']
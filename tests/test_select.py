@@ -0,0 +1,43 @@
+"""Entry selection: --sorting and --key."""
+import re
+
+import pytest
+
+import main
+
+BIB = r"""
+@misc{zed, author = {Zed, A.}, title = {T-zed}, year = {2003}}
+@misc{none, title = {T-none}, year = {2001}}
+@misc{oberg, author = {{\"O}berg, B.}, title = {T-oberg}}
+@misc{adams, author = {Adams, C.}, title = {T-adams}, year = {2001}}
+@misc{adams2, editor = {Adams, C.}, title = {T-adams2}, year = {2003}}
+"""
+
+
+@pytest.fixture
+def bib(tmp_path):
+    path = tmp_path / 'refs.bib'
+    path.write_text(BIB)
+    return str(path)
+
+
+def titles(bib, **options):
+    return re.findall(r'T-(\w+)', main.bibtex_to_plain(bib, use_cache=False, **options))
+
+
+def test_no_sorting_keeps_file_order(bib):
+    assert titles(bib) == ['zed', 'none', 'oberg', 'adams', 'adams2']
+
+
+def test_sort_by_year_ties_keep_file_order_missing_last(bib):
+    assert titles(bib, sorting='year') == ['none', 'adams', 'zed', 'adams2', 'oberg']
+
+
+def test_sort_by_author_ignores_latex_missing_last(bib):
+    # {\"O}berg sorts as "oberg"; editors stand in for missing authors
+    assert titles(bib, sorting='author') == ['adams', 'adams2', 'oberg', 'zed', 'none']
+
+
+def test_key_selects_exactly_that_entry(bib):
+    assert titles(bib, key='oberg') == ['oberg']
+    assert main.bibtex_to_plain(bib, key='missing', use_cache=False) == ""